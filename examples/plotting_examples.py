@@ -5,6 +5,8 @@ Plotting examples for Phonemescape IPA library.
 
 import phonemescape as pm
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
 import numpy as np
 
 def main():
@@ -99,33 +101,36 @@ def main():
     thresholds = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6]
     vowel_subset = ['i', 'e', 'ɛ', 'a', 'ɑ', 'o', 'ɔ', 'u']
     
+    # The matrix, positions and candidate edges don't depend on the threshold
+    similarity_matrix = ipa.get_similarity_matrix(vowel_subset)
+    
+    positions = {}
+    for phoneme in vowel_subset:
+        if phoneme in ipa.vowels:
+            x, y, _, _, _, _ = ipa.vowels[phoneme]
+            positions[phoneme] = (x, y)
+    
+    n = len(vowel_subset)
+    edges = [(vowel_subset[i], vowel_subset[j], similarity_matrix[i, j])
+             for i in range(n) for j in range(i + 1, n)
+             if vowel_subset[i] in positions and vowel_subset[j] in positions]
+    segments = np.array([[positions[p1], positions[p2]] for p1, p2, _ in edges]).reshape(-1, 2, 2)
+    edge_sims = np.array([s for _, _, s in edges])
+    node_xs, node_ys = ipa.get_positions(list(positions))
+    
     for idx, threshold in enumerate(thresholds):
         ax = axes[idx // 3, idx % 3]
         
-        # Create similarity matrix
-        similarity_matrix = ipa.get_similarity_matrix(vowel_subset)
-        
-        # Plot network
-        positions = {}
-        for phoneme in vowel_subset:
-            if phoneme in ipa.vowels:
-                x, y, _, _, _, _ = ipa.vowels[phoneme]
-                positions[phoneme] = (x, y)
-        
-        # Plot edges
-        for i in range(len(vowel_subset)):
-            for j in range(i + 1, len(vowel_subset)):
-                similarity = similarity_matrix[i, j]
-                if similarity >= threshold:
-                    phoneme1, phoneme2 = vowel_subset[i], vowel_subset[j]
-                    if phoneme1 in positions and phoneme2 in positions:
-                        x1, y1 = positions[phoneme1]
-                        x2, y2 = positions[phoneme2]
-                        ax.plot([x1, x2], [y1, y2], 'gray', alpha=similarity, linewidth=similarity * 2)
+        # Plot edges as a single collection, alpha carried per edge in RGBA
+        keep = edge_sims >= threshold
+        edge_colors = np.tile(to_rgba('gray'), (int(keep.sum()), 1))
+        edge_colors[:, 3] = edge_sims[keep]
+        ax.add_collection(LineCollection(segments[keep], colors=edge_colors,
+                                         linewidths=edge_sims[keep] * 2))
         
         # Plot nodes
+        ax.scatter(node_xs, node_ys, s=200, c='lightblue', edgecolors='black', linewidth=1)
         for phoneme, (x, y) in positions.items():
-            ax.scatter(x, y, s=200, c='lightblue', edgecolors='black', linewidth=1)
             ax.annotate(phoneme, (x, y), fontsize=10, ha='center', va='center', fontweight='bold')
         
         ax.set_title(f'Threshold ≥ {threshold}', fontsize=12)
@@ -147,9 +152,9 @@ def main():
     front_vowels = ipa.find_phonemes_by_features(backness='front')
     # Filter to only include actual vowels
     front_vowels = [v for v in front_vowels if ipa.is_vowel(v)]
-    for phoneme in front_vowels:
-        x, y, _, _, _, _ = ipa.vowels[phoneme]
-        ax1.scatter(x, y, s=300, c='red', alpha=0.7, edgecolors='black')
+    xs, ys = ipa.get_positions(front_vowels)
+    ax1.scatter(xs, ys, s=300, c='red', alpha=0.7, edgecolors='black')
+    for phoneme, x, y in zip(front_vowels, xs, ys):
         ax1.annotate(phoneme, (x, y), fontsize=12, ha='center', va='center', fontweight='bold')
     ax1.set_title('Front Vowels', fontsize=14, fontweight='bold')
     ax1.set_xlim(0, 7)
@@ -161,9 +166,9 @@ def main():
     back_vowels = ipa.find_phonemes_by_features(backness='back')
     # Filter to only include actual vowels
     back_vowels = [v for v in back_vowels if ipa.is_vowel(v)]
-    for phoneme in back_vowels:
-        x, y, _, _, _, _ = ipa.vowels[phoneme]
-        ax2.scatter(x, y, s=300, c='blue', alpha=0.7, edgecolors='black')
+    xs, ys = ipa.get_positions(back_vowels)
+    ax2.scatter(xs, ys, s=300, c='blue', alpha=0.7, edgecolors='black')
+    for phoneme, x, y in zip(back_vowels, xs, ys):
         ax2.annotate(phoneme, (x, y), fontsize=12, ha='center', va='center', fontweight='bold')
     ax2.set_title('Back Vowels', fontsize=14, fontweight='bold')
     ax2.set_xlim(0, 7)
@@ -175,9 +180,9 @@ def main():
     bilabial_consonants = ipa.find_phonemes_by_features(place='bilabial')
     # Filter to only include actual consonants
     bilabial_consonants = [c for c in bilabial_consonants if ipa.is_consonant(c)]
-    for phoneme in bilabial_consonants:
-        x, y, _, _, _, _ = ipa.consonants[phoneme]
-        ax3.scatter(x, y, s=300, c='green', alpha=0.7, edgecolors='black')
+    xs, ys = ipa.get_positions(bilabial_consonants)
+    ax3.scatter(xs, ys, s=300, c='green', alpha=0.7, edgecolors='black')
+    for phoneme, x, y in zip(bilabial_consonants, xs, ys):
         ax3.annotate(phoneme, (x, y), fontsize=12, ha='center', va='center', fontweight='bold')
     ax3.set_title('Bilabial Consonants', fontsize=14, fontweight='bold')
     ax3.set_xlim(0, 11)
@@ -189,9 +194,9 @@ def main():
     velar_consonants = ipa.find_phonemes_by_features(place='velar')
     # Filter to only include actual consonants
     velar_consonants = [c for c in velar_consonants if ipa.is_consonant(c)]
-    for phoneme in velar_consonants:
-        x, y, _, _, _, _ = ipa.consonants[phoneme]
-        ax4.scatter(x, y, s=300, c='purple', alpha=0.7, edgecolors='black')
+    xs, ys = ipa.get_positions(velar_consonants)
+    ax4.scatter(xs, ys, s=300, c='purple', alpha=0.7, edgecolors='black')
+    for phoneme, x, y in zip(velar_consonants, xs, ys):
         ax4.annotate(phoneme, (x, y), fontsize=12, ha='center', va='center', fontweight='bold')
     ax4.set_title('Velar Consonants', fontsize=14, fontweight='bold')
     ax4.set_xlim(0, 11)
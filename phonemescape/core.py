@@ -2,12 +2,30 @@
 Core functionality for the Phonemescape IPA library.
 """
 
-from typing import Dict, List, Tuple, Optional, Union
+import re
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple, Optional, Union
 import numpy as np
-from .data import IPA_VOWELS, IPA_CONSONANTS
-from .plotting import IPAPlotter
+from .data import (IPA_VOWELS, IPA_CONSONANTS, IPA_VOWEL_SYMBOLS,
+                   PHONEME_SYMBOLS, PHONEME_INDEX, IS_VOWEL_MASK)
+from .ranking import top_k_order
 from .similarity import MouthShapeSimilarity
 
+# The plotter is imported lazily (see the plotter property below);
+# these imports only serve the annotations
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    from .plotting import IPAPlotter
+
+
+def _feature_hits(values: Dict[Any, set], value: Any) -> set:
+    """Phonemes whose feature equals ``value``, given one feature's value -> phonemes index."""
+    try:
+        return values.get(value, set())
+    except TypeError:
+        # Unhashable query value: compare by equality, as a linear scan would
+        return set().union(*(hits for candidate, hits in values.items() if candidate == value))
+
 
 class Phonemescape:
     """
@@ -20,16 +38,107 @@ class Phonemescape:
     - Analyzing phoneme relationships
     """
     
+    # Shared read-only tables; as class attributes they stay out of pickled state
+    vowels = IPA_VOWELS
+    consonants = IPA_CONSONANTS
+    _phoneme_index = PHONEME_INDEX  # Row/column of each phoneme in the similarity table
+    
     def __init__(self):
         """Initialize the Phonemescape library."""
-        self.vowels = IPA_VOWELS
-        self.consonants = IPA_CONSONANTS
-        self.plotter = IPAPlotter()
-        self.similarity_calculator = MouthShapeSimilarity()
+        # Vowels come first in PHONEME_SYMBOLS, so they fill the first rows
+        self._n_vowels = len(IPA_VOWEL_SYMBOLS)
+        self._all_phonemes = PHONEME_SYMBOLS
+        
+        self._is_vowel_arr = IS_VOWEL_MASK
+        self._xy = np.array([v[:2] for v in self.vowels.values()] +
+                            [c[:2] for c in self.consonants.values()], dtype=float)
+        
+        # Longest symbols first so multi-character phonemes win the match
+        symbols = sorted(self._phoneme_index, key=len, reverse=True)
+        self._phoneme_re = re.compile('|'.join(map(re.escape, symbols)))
+        
+        # Phoneme info dicts are built once; get_phoneme_info hands out copies
+        self._info_table = self._build_info_table()
+        
+        # Serialized export strings, keyed by format
+        self._export_cache = {}
+        
+        # Inverted index: phoneme type -> feature -> value -> set of phonemes
+        self._feature_index = self._build_feature_index()
+        # Query results keyed by frozenset of (feature, value) pairs
+        self._feature_query_cache = {}
+    
+    def _build_info_table(self) -> Dict[str, Dict]:
+        """Build the detailed information dict for every phoneme."""
+        table = {}
+        for phoneme, (x, y, height, backness, roundedness, description) in self.vowels.items():
+            table[phoneme] = {
+                'symbol': phoneme,
+                'type': 'vowel',
+                'coordinates': (x, y),
+                'height': height,
+                'backness': backness,
+                'roundedness': roundedness,
+                'description': description
+            }
+        for phoneme, (x, y, manner, place, voicing, description) in self.consonants.items():
+            table[phoneme] = {
+                'symbol': phoneme,
+                'type': 'consonant',
+                'coordinates': (x, y),
+                'manner': manner,
+                'place': place,
+                'voicing': voicing,
+                'description': description
+            }
+        return table
+    
+    def _build_feature_index(self) -> Dict[str, Dict[str, Dict[str, set]]]:
+        """Index phonemes by each of their articulatory feature values."""
+        index = {'vowel': {}, 'consonant': {}}
+        for phoneme, (x, y, height, backness, roundedness, _) in self.vowels.items():
+            for key, value in (('type', 'vowel'), ('height', height),
+                               ('backness', backness), ('roundedness', roundedness)):
+                index['vowel'].setdefault(key, {}).setdefault(value, set()).add(phoneme)
+        for phoneme, (x, y, manner, place, voicing, _) in self.consonants.items():
+            for key, value in (('type', 'consonant'), ('manner', manner),
+                               ('place', place), ('voicing', voicing)):
+                index['consonant'].setdefault(key, {}).setdefault(value, set()).add(phoneme)
+        return index
+    
+    @cached_property
+    def plotter(self) -> 'IPAPlotter':
+        """Chart plotter, created on first use so data-only callers skip matplotlib."""
+        from .plotting import IPAPlotter
+        return IPAPlotter()
+    
+    @cached_property
+    def similarity_calculator(self) -> MouthShapeSimilarity:
+        """Similarity calculator, created on first use."""
+        return MouthShapeSimilarity()
+    
+    @cached_property
+    def _similarity_table(self) -> np.ndarray:
+        """
+        Pairwise similarity of every known phoneme, built once on first use.
+        
+        Stored read-only so slices and lookups can share it safely.
+        """
+        table = self.similarity_calculator.similarity_matrix(self._all_phonemes)
+        table.flags.writeable = False
+        return table
+    
+    def _phoneme_indices(self, phonemes: List[str]) -> np.ndarray:
+        """Map phoneme symbols to their rows in the similarity table."""
+        try:
+            return np.fromiter((self._phoneme_index[p] for p in phonemes),
+                               dtype=np.intp, count=len(phonemes))
+        except KeyError as e:
+            raise ValueError(f"Phoneme '{e.args[0]}' not found") from None
     
     def get_all_phonemes(self) -> List[str]:
         """Get list of all available phonemes."""
-        return list(self.vowels.keys()) + list(self.consonants.keys())
+        return list(self._all_phonemes)
     
     def get_vowels(self) -> Dict[str, Tuple]:
         """Get all vowel data."""
@@ -49,30 +158,26 @@ class Phonemescape:
     
     def get_phoneme_info(self, phoneme: str) -> Dict:
         """Get detailed information about a phoneme."""
-        if phoneme in self.vowels:
-            x, y, height, backness, roundedness, description = self.vowels[phoneme]
-            return {
-                'symbol': phoneme,
-                'type': 'vowel',
-                'coordinates': (x, y),
-                'height': height,
-                'backness': backness,
-                'roundedness': roundedness,
-                'description': description
-            }
-        elif phoneme in self.consonants:
-            x, y, manner, place, voicing, description = self.consonants[phoneme]
-            return {
-                'symbol': phoneme,
-                'type': 'consonant',
-                'coordinates': (x, y),
-                'manner': manner,
-                'place': place,
-                'voicing': voicing,
-                'description': description
-            }
-        else:
-            raise ValueError(f"Phoneme '{phoneme}' not found")
+        try:
+            return dict(self._info_table[phoneme])
+        except KeyError:
+            raise ValueError(f"Phoneme '{phoneme}' not found") from None
+    
+    def get_positions(self, phonemes: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get chart coordinates for a list of phonemes.
+        
+        Vowels and consonants are on separate planes, so mixing them only
+        makes sense when plotting each type on its own axes.
+        
+        Args:
+            phonemes: List of phoneme symbols
+            
+        Returns:
+            Tuple of (xs, ys) arrays aligned with the input list
+        """
+        xy = self._xy[self._phoneme_indices(phonemes)]
+        return xy[:, 0], xy[:, 1]
     
     def find_similar_phonemes(self, target_phoneme: str, 
                             phoneme_type: str = 'both',
@@ -88,25 +193,45 @@ class Phonemescape:
         Returns:
             List of (phoneme, similarity) tuples
         """
-        # Determine which phonemes to search
+        target_idx = self._phoneme_index.get(target_phoneme)
+        if target_idx is None:
+            raise ValueError(f"Target phoneme not found: {target_phoneme}")
+        
+        # Determine which phonemes to search (rows of the similarity table)
+        n_vowels = self._n_vowels
         if phoneme_type == 'vowel':
-            search_phonemes = list(self.vowels.keys())
+            search_idx = np.arange(n_vowels)
         elif phoneme_type == 'consonant':
-            search_phonemes = list(self.consonants.keys())
+            search_idx = np.arange(n_vowels, len(self._all_phonemes))
         else:  # 'both'
-            search_phonemes = self.get_all_phonemes()
+            search_idx = np.arange(len(self._all_phonemes))
+        search_idx = search_idx[search_idx != target_idx]
+        sims = self._similarity_table[target_idx, search_idx]
         
-        return self.similarity_calculator.most_similar_phonemes(
-            target_phoneme, search_phonemes, top_k
-        )
+        return [(self._all_phonemes[search_idx[i]], float(sims[i])) for i in top_k_order(sims, top_k)]
     
     def calculate_similarity(self, phoneme1: str, phoneme2: str) -> float:
         """Calculate similarity between two phonemes."""
-        return self.similarity_calculator.phoneme_similarity(phoneme1, phoneme2)
+        i = self._phoneme_index.get(phoneme1)
+        j = self._phoneme_index.get(phoneme2)
+        if i is None or j is None:
+            raise ValueError(f"One or both phonemes not found: {phoneme1}, {phoneme2}")
+        return float(self._similarity_table[i, j])
     
     def get_similarity_matrix(self, phonemes: List[str]) -> np.ndarray:
-        """Calculate similarity matrix for a list of phonemes."""
-        return self.similarity_calculator.similarity_matrix(phonemes)
+        """
+        Calculate similarity matrix for a list of phonemes.
+        
+        The matrix is sliced out of a table covering every known phoneme, so
+        repeated calls cost a single fancy-indexing operation. Lists with
+        unknown symbols go to the similarity calculator, which keeps its own
+        validation (a single unknown phoneme still gives [[1.]]).
+        """
+        try:
+            idx = self._phoneme_indices(phonemes)
+        except ValueError:
+            return self.similarity_calculator.similarity_matrix(phonemes)
+        return self._similarity_table[np.ix_(idx, idx)]
     
     def plot_vowel_chart(self, highlight: Optional[List[str]] = None, **kwargs) -> 'plt.Figure':
         """Create vowel chart visualization."""
@@ -147,21 +272,23 @@ class Phonemescape:
         Returns:
             Dictionary with analysis results
         """
-        phonemes = list(word)  # Simple split - assumes each character is a phoneme
-        
-        valid_phonemes = []
-        invalid_phonemes = []
+        # Longest-match tokenization; leftover characters are reported as invalid
+        valid_phonemes = self._phoneme_re.findall(word)
+        invalid_phonemes = list(self._phoneme_re.sub('', word))
         
-        for phoneme in phonemes:
-            if phoneme in self.vowels or phoneme in self.consonants:
-                valid_phonemes.append(phoneme)
-            else:
-                invalid_phonemes.append(phoneme)
+        idx = self._phoneme_indices(valid_phonemes)
+        n = len(idx)
+        n_vowels = int(self._is_vowel_arr[idx].sum())
         
-        # Calculate pairwise similarities
-        if len(valid_phonemes) > 1:
-            similarity_matrix = self.get_similarity_matrix(valid_phonemes)
-            avg_similarity = np.mean(similarity_matrix[np.triu_indices_from(similarity_matrix, k=1)])
+        # Mean pairwise similarity over distinct positions. Weighting the
+        # table block of the unique phonemes by their counts c gives the
+        # sum over all ordered pairs as c.S.c - c.diag(S), so long inputs
+        # never allocate an n x n matrix.
+        if n > 1:
+            unique_idx, counts = np.unique(idx, return_counts=True)
+            block = self._similarity_table[np.ix_(unique_idx, unique_idx)]
+            pair_total = counts @ block @ counts - counts @ block.diagonal()
+            avg_similarity = pair_total / (n * (n - 1))
         else:
             avg_similarity = 1.0
         
@@ -169,11 +296,11 @@ class Phonemescape:
             'word': word,
             'phonemes': valid_phonemes,
             'invalid_phonemes': invalid_phonemes,
-            'n_phonemes': len(valid_phonemes),
-            'n_vowels': len([p for p in valid_phonemes if self.is_vowel(p)]),
-            'n_consonants': len([p for p in valid_phonemes if self.is_consonant(p)]),
+            'n_phonemes': n,
+            'n_vowels': n_vowels,
+            'n_consonants': n - n_vowels,
             'average_similarity': avg_similarity,
-            'phoneme_details': [self.get_phoneme_info(p) for p in valid_phonemes]
+            'phoneme_details': [dict(self._info_table[p]) for p in valid_phonemes]
         }
     
     def get_phoneme_clusters(self, phonemes: List[str], n_clusters: int = 3) -> Dict[int, List[str]]:
@@ -184,6 +311,9 @@ class Phonemescape:
         """
         Find phonemes matching specific articulatory features.
         
+        Features that do not apply to a phoneme type (e.g. place for
+        vowels) are ignored for that type.
+        
         Args:
             **features: Key-value pairs of features to match
                        (e.g., height='close', place='bilabial')
@@ -191,35 +321,30 @@ class Phonemescape:
         Returns:
             List of matching phonemes
         """
-        matches = []
+        try:
+            key = frozenset(features.items())
+        except TypeError:
+            # Unhashable values (e.g. a list) can't key the cache; resolve directly
+            return list(self._feature_query(features.items()))
         
-        # Check vowels
-        for phoneme, (x, y, height, backness, roundedness, _) in self.vowels.items():
-            vowel_features = {
-                'type': 'vowel',
-                'height': height,
-                'backness': backness,
-                'roundedness': roundedness
-            }
-            
-            if all(vowel_features.get(k) == v for k, v in features.items() 
-                   if k in vowel_features):
-                matches.append(phoneme)
+        matches = self._feature_query_cache.get(key)
+        if matches is None:
+            matches = self._feature_query_cache[key] = self._feature_query(key)
+            if len(self._feature_query_cache) > 256:
+                del self._feature_query_cache[next(iter(self._feature_query_cache))]
+        return list(matches)
+    
+    def _feature_query(self, features: Iterable[Tuple[str, Any]]) -> Tuple[str, ...]:
+        """Resolve a feature query against the inverted index."""
+        matches = []
         
-        # Check consonants
-        for phoneme, (x, y, manner, place, voicing, _) in self.consonants.items():
-            consonant_features = {
-                'type': 'consonant',
-                'manner': manner,
-                'place': place,
-                'voicing': voicing
-            }
-            
-            if all(consonant_features.get(k) == v for k, v in features.items() 
-                   if k in consonant_features):
-                matches.append(phoneme)
+        for index in self._feature_index.values():
+            # Only features that exist for this phoneme type constrain it
+            sets = [_feature_hits(index[k], v) for k, v in features if k in index]
+            hits = set.intersection(*sets) if sets else set.union(*index['type'].values())
+            matches.extend(sorted(hits, key=self._phoneme_index.__getitem__))
         
-        return matches
+        return tuple(matches)
     
     def export_data(self, format: str = 'dict') -> Union[Dict, str]:
         """
@@ -238,9 +363,17 @@ class Phonemescape:
         
         if format == 'dict':
             return data
-        elif format == 'json':
+        
+        # The tables never change, so each serialized string is built once
+        if format not in self._export_cache:
+            self._export_cache[format] = self._serialize_data(data, format)
+        return self._export_cache[format]
+    
+    def _serialize_data(self, data: Dict, format: str) -> str:
+        """Render the phoneme tables as a JSON or CSV string."""
+        if format == 'json':
             import json
-            return json.dumps(data, indent=2, ensure_ascii=False)
+            return json.dumps({k: dict(v) for k, v in data.items()}, indent=2, ensure_ascii=False)
         elif format == 'csv':
             # Create CSV format
             import csv
@@ -15,6 +15,10 @@ These are SEPARATE coordinate planes - vowels and consonants should
 NEVER be compared directly on the same plane.
 """
 
+from types import MappingProxyType
+
+import numpy as np
+
 # =============================================================================
 # VOWEL DATA - Based on official IPA vowel trapezoid (2020)
 # =============================================================================
@@ -27,7 +31,7 @@ NEVER be compared directly on the same plane.
 #
 # Pairs: unrounded • rounded (left • right in each position)
 
-IPA_VOWELS = {
+IPA_VOWELS = MappingProxyType({
     # Close (Y=0) - Top row of trapezoid
     'i': (0.0, 0.0, 'close', 'front', 'unrounded', 'Close front unrounded vowel'),
     'y': (0.1, 0.0, 'close', 'front', 'rounded', 'Close front rounded vowel'),
@@ -69,7 +73,7 @@ IPA_VOWELS = {
     'ɶ': (0.7, 3.0, 'open', 'front', 'rounded', 'Open front rounded vowel'),
     'ɑ': (2.0, 3.0, 'open', 'back', 'unrounded', 'Open back unrounded vowel'),
     'ɒ': (2.1, 3.0, 'open', 'back', 'rounded', 'Open back rounded vowel'),
-}
+})
 
 # =============================================================================
 # CONSONANT DATA - Based on official IPA pulmonic consonant chart (2020)
@@ -103,7 +107,7 @@ IPA_VOWELS = {
 # Voicing: In each cell, voiceless is left, voiced is right
 # Shaded cells = articulation judged impossible
 
-IPA_CONSONANTS = {
+IPA_CONSONANTS = MappingProxyType({
     # ===================
     # PLOSIVES (Y=0)
     # ===================
@@ -194,15 +198,21 @@ IPA_CONSONANTS = {
     'ɭ': (5, 7, 'lateral-approximant', 'retroflex', 'voiced', 'Voiced retroflex lateral approximant'),
     'ʎ': (6, 7, 'lateral-approximant', 'palatal', 'voiced', 'Voiced palatal lateral approximant'),
     'ʟ': (7, 7, 'lateral-approximant', 'velar', 'voiced', 'Voiced velar lateral approximant'),
-}
+})
 
 # =============================================================================
 # ARTICULATORY FEATURE MAPPINGS
 # =============================================================================
 # These map categorical features to numerical values for similarity calculations
 # IMPORTANT: Vowels and consonants use SEPARATE coordinate systems
+#
+# The phoneme and feature tables, and every lookup derived from them below,
+# are published read-only (MappingProxyType views, tuples, non-writeable
+# arrays), so results derived from them can be cached safely. Classes share
+# the mappings as class attributes: mappingproxy objects cannot be pickled,
+# and class attributes stay out of an instance's pickled state.
 
-ARTICULATORY_FEATURES = {
+_ARTICULATORY_FEATURES = {
     # Vowel features (trapezoid coordinate system)
     'vowel_height': {
         'close': 0.0,
@@ -254,6 +264,9 @@ ARTICULATORY_FEATURES = {
         'voiced': 1
     }
 }
+ARTICULATORY_FEATURES = MappingProxyType({
+    name: MappingProxyType(mapping) for name, mapping in _ARTICULATORY_FEATURES.items()
+})
 
 # =============================================================================
 # COORDINATE SYSTEM METADATA
@@ -285,4 +298,99 @@ CONSONANT_COORD_INFO = {
         (0, 'Plosive'), (1, 'Nasal'), (2, 'Trill'), (3, 'Tap/Flap'),
         (4, 'Fricative'), (5, 'Lat. Fricative'), (6, 'Approximant'), (7, 'Lat. Approximant')
     ]
-}
\ No newline at end of file
+}
+
+# =============================================================================
+# ARRAY VIEWS OF THE PHONEME DATA
+# =============================================================================
+# Column-oriented copies of the dicts above, built once at import.
+# Row i of IPA_VOWELS_ARRAY describes IPA_VOWEL_SYMBOLS[i] (same for consonants).
+# Categorical features are stored as uint8 codes from FEATURE_CODES, so a
+# whole record is 11 bytes and feature filters become boolean masks, e.g.
+#   IPA_VOWELS_ARRAY['backness'] == FEATURE_CODES['vowel_backness']['front']
+#   (IPA_CONSONANTS_ARRAY['manner'] == FEATURE_CODES['consonant_manner']['fricative'])
+#   & (IPA_CONSONANTS_ARRAY['voicing'] == FEATURE_CODES['consonant_voicing']['voiced'])
+# Descriptions are kept out of the records in parallel tuples.
+
+# Code of each categorical value: its position in the ARTICULATORY_FEATURES map
+FEATURE_CODES = MappingProxyType({
+    name: MappingProxyType({value: code for code, value in enumerate(values)})
+    for name, values in ARTICULATORY_FEATURES.items()
+})
+
+_VOWEL_DTYPE = np.dtype([
+    ('x', 'f4'), ('y', 'f4'),
+    ('height', 'u1'), ('backness', 'u1'), ('roundedness', 'u1'),
+])
+_CONSONANT_DTYPE = np.dtype([
+    ('x', 'f4'), ('y', 'f4'),
+    ('manner', 'u1'), ('place', 'u1'), ('voicing', 'u1'),
+])
+
+IPA_VOWEL_SYMBOLS = tuple(IPA_VOWELS.keys())
+IPA_VOWEL_DESCRIPTIONS = tuple(v[5] for v in IPA_VOWELS.values())
+IPA_VOWELS_ARRAY = np.array([
+    (x, y,
+     FEATURE_CODES['vowel_height'][height],
+     FEATURE_CODES['vowel_backness'][backness],
+     FEATURE_CODES['vowel_roundedness'][roundedness])
+    for x, y, height, backness, roundedness, _ in IPA_VOWELS.values()
+], dtype=_VOWEL_DTYPE)
+IPA_VOWELS_ARRAY.flags.writeable = False
+
+IPA_CONSONANT_SYMBOLS = tuple(IPA_CONSONANTS.keys())
+IPA_CONSONANT_DESCRIPTIONS = tuple(c[5] for c in IPA_CONSONANTS.values())
+IPA_CONSONANTS_ARRAY = np.array([
+    (x, y,
+     FEATURE_CODES['consonant_manner'][manner],
+     FEATURE_CODES['consonant_place'][place],
+     FEATURE_CODES['consonant_voicing'][voicing])
+    for x, y, manner, place, voicing, _ in IPA_CONSONANTS.values()
+], dtype=_CONSONANT_DTYPE)
+IPA_CONSONANTS_ARRAY.flags.writeable = False
+
+# Reverse lookup of FEATURE_CODES: code -> categorical value
+FEATURE_VALUES = MappingProxyType({name: tuple(values) for name, values in ARTICULATORY_FEATURES.items()})
+
+# Index of each symbol's row in the arrays above and the feature matrices below
+IPA_VOWEL_INDEX = MappingProxyType({symbol: i for i, symbol in enumerate(IPA_VOWEL_SYMBOLS)})
+IPA_CONSONANT_INDEX = MappingProxyType({symbol: i for i, symbol in enumerate(IPA_CONSONANT_SYMBOLS)})
+
+# Unified inventory: vowels first, then consonants
+PHONEME_SYMBOLS = IPA_VOWEL_SYMBOLS + IPA_CONSONANT_SYMBOLS
+PHONEME_INDEX = MappingProxyType({symbol: i for i, symbol in enumerate(PHONEME_SYMBOLS)})
+IS_VOWEL_MASK = np.zeros(len(PHONEME_SYMBOLS), dtype=bool)
+IS_VOWEL_MASK[:len(IPA_VOWEL_SYMBOLS)] = True
+IS_VOWEL_MASK.flags.writeable = False
+
+# Chart position (x, y) of every phoneme, on its own type's plane
+IPA_POS = MappingProxyType({symbol: entry[:2] for table in (IPA_VOWELS, IPA_CONSONANTS)
+                            for symbol, entry in table.items()})
+
+# Numeric vowel feature matrix (float32, C-contiguous) using ARTICULATORY_FEATURES
+# values, one row per symbol: [height, backness, roundedness]
+VOWEL_FEATURE_MATRIX = np.array([
+    (ARTICULATORY_FEATURES['vowel_height'][height],
+     ARTICULATORY_FEATURES['vowel_backness'][backness],
+     ARTICULATORY_FEATURES['vowel_roundedness'][roundedness])
+    for _, _, height, backness, roundedness, _ in IPA_VOWELS.values()
+], dtype=np.float32)
+VOWEL_FEATURE_MATRIX.flags.writeable = False
+
+# Block layout over the unified inventory (rows follow PHONEME_SYMBOLS), in
+# the same ARTICULATORY_FEATURES values as VOWEL_FEATURE_MATRIX above:
+# vowel [height, backness, roundedness] in columns 0-2, consonant
+# [manner, place, voicing] in columns 3-5, and zeros in the columns that do
+# not apply to a phoneme's type (0 is also a real value, so use IS_VOWEL_MASK
+# to tell the blocks apart). (Ordinal FEATURE_CODES live in the IPA_*_ARRAY records.)
+# Both planes share one matrix, so a symbol string maps to rows with
+# PHONEME_FEATURE_MATRIX[[PHONEME_INDEX[s] for s in symbols]].
+PHONEME_FEATURE_MATRIX = np.zeros((len(PHONEME_SYMBOLS), 6), dtype=np.float32)
+PHONEME_FEATURE_MATRIX[:len(IPA_VOWEL_SYMBOLS), :3] = VOWEL_FEATURE_MATRIX
+PHONEME_FEATURE_MATRIX[len(IPA_VOWEL_SYMBOLS):, 3:] = [
+    (ARTICULATORY_FEATURES['consonant_manner'][manner],
+     ARTICULATORY_FEATURES['consonant_place'][place],
+     ARTICULATORY_FEATURES['consonant_voicing'][voicing])
+    for _, _, manner, place, voicing, _ in IPA_CONSONANTS.values()
+]
+PHONEME_FEATURE_MATRIX.flags.writeable = False
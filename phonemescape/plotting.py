@@ -5,11 +5,66 @@ Based on official IPA chart (2020 revision).
 Vowels and consonants are plotted on SEPARATE coordinate planes.
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 import numpy as np
-from typing import Dict, List, Tuple, Optional
-from .data import IPA_VOWELS, IPA_CONSONANTS, VOWEL_COORD_INFO, CONSONANT_COORD_INFO
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple, Optional
+from .data import (VOWEL_COORD_INFO, CONSONANT_COORD_INFO,
+                   IPA_VOWEL_SYMBOLS, IPA_CONSONANT_SYMBOLS, IPA_VOWEL_INDEX, IPA_CONSONANT_INDEX,
+                   IPA_VOWELS_ARRAY, IPA_CONSONANTS_ARRAY, FEATURE_VALUES, IPA_POS)
+
+# matplotlib is imported inside the drawing methods, so importing the package
+# (which re-exports IPAPlotter) does not pay for pyplot and backend setup
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as patches
+
+# Per-inventory columns for the chart scatters: symbols, row index, x, y,
+# color feature codes and the feature values those codes stand for
+_CHART_LAYERS = {
+    'vowel': (IPA_VOWEL_SYMBOLS, IPA_VOWEL_INDEX, IPA_VOWELS_ARRAY['x'], IPA_VOWELS_ARRAY['y'],
+              IPA_VOWELS_ARRAY['roundedness'], FEATURE_VALUES['vowel_roundedness']),
+    'consonant': (IPA_CONSONANT_SYMBOLS, IPA_CONSONANT_INDEX, IPA_CONSONANTS_ARRAY['x'], IPA_CONSONANTS_ARRAY['y'],
+                  IPA_CONSONANTS_ARRAY['voicing'], FEATURE_VALUES['consonant_voicing']),
+}
+
+# Static chart scaffolding, built once at import
+_TEXT_KW = dict(ha='center', va='center', fontweight='bold')
+_TRAPEZOID_X = np.array([0.0, 2.0, 2.1, 0.6, 0.0])
+_TRAPEZOID_Y = np.array([0.0, 0.0, 3.0, 3.0, 0.0])
+
+
+def _split_ticks(ticks: Sequence[Tuple[float, str]]) -> Tuple[np.ndarray, Tuple[str, ...]]:
+    """Split [(position, label), ...] into a float position array and a label tuple."""
+    positions, labels = zip(*ticks)
+    return np.array(positions, dtype=float), labels
+
+
+_VOWEL_XTICKS, _VOWEL_XTICKLABELS = _split_ticks(VOWEL_COORD_INFO['x_ticks'])
+_VOWEL_YTICKS, _VOWEL_YTICKLABELS = _split_ticks(VOWEL_COORD_INFO['y_ticks'])
+_CONSONANT_XTICKS, _CONSONANT_XTICKLABELS = _split_ticks(CONSONANT_COORD_INFO['x_ticks'])
+_CONSONANT_YTICKS, _CONSONANT_YTICKLABELS = _split_ticks(CONSONANT_COORD_INFO['y_ticks'])
+
+# Abbreviated labels for the narrower consonant panel of the combined chart
+_SHORT_PLACE_LABELS = ('Bilab.', 'Labiod.', 'Dent.', 'Alv.', 'Postalv.',
+                       'Retrof.', 'Pal.', 'Vel.', 'Uv.', 'Phar.', 'Glot.')
+_SHORT_MANNER_LABELS = ('Plosive', 'Nasal', 'Trill', 'Tap', 'Fricative', 'Lat.Fric.', 'Approx.', 'Lat.Appr.')
+
+# Cell borders of the consonant table: 12 vertical then 9 horizontal segments
+_CONSONANT_GRID_X = np.arange(12) - 0.5
+_CONSONANT_GRID_Y = np.arange(9) - 0.5
+_CONSONANT_GRID_SEGMENTS = np.concatenate([
+    [[(x, -0.5), (x, 7.5)] for x in _CONSONANT_GRID_X],
+    [[(-0.5, y), (10.5, y)] for y in _CONSONANT_GRID_Y],
+])
+
+# Horizontal height levels, each clipped to the trapezoid's width at that height
+_HEIGHT_LEVELS = np.arange(4)
+_HEIGHT_SEGMENTS = np.stack([
+    np.column_stack([0.6 * _HEIGHT_LEVELS / 3, _HEIGHT_LEVELS]),
+    np.column_stack([2 + 0.1 * _HEIGHT_LEVELS / 3, _HEIGHT_LEVELS]),
+], axis=1)
+
+# rcParams that change text extents or spacing, and with them the tight_layout fit
+_LAYOUT_RC_SUFFIXES = ('size', 'pad', 'weight', 'family', 'stretch', 'style', 'dpi')
 
 
 class IPAPlotter:
@@ -25,11 +80,112 @@ class IPAPlotter:
             'voiceless': '#95A5A6',   # Gray for voiceless
             'voiced': '#3498DB'       # Blue for voiced
         }
+        
+        # Released figures waiting for reuse, keyed by size in inches
+        self._fig_pool = {}
+        # Subplot params found by tight_layout, keyed by chart, size, title and text settings
+        self._layout_cache = {}
+    
+    def get_pooled_fig(self, figsize: Tuple[float, float]) -> 'plt.Figure':
+        """
+        Take a blank figure of the given size from the pool, or create one.
+        
+        Pass the result as ``fig=`` to a plot method to skip figure and canvas
+        setup, and hand it back with release_fig() once it has been saved.
+        
+        Args:
+            figsize: Figure size in inches
+            
+        Returns:
+            matplotlib Figure object
+        """
+        import matplotlib.pyplot as plt
+        pooled = self._fig_pool.get(tuple(figsize))
+        if pooled:
+            return pooled.pop()
+        with plt.ioff():
+            return plt.figure(figsize=figsize)
+    
+    def release_fig(self, fig: 'plt.Figure') -> None:
+        """Clear a figure and return it to the pool for get_pooled_fig()."""
+        fig.clear()
+        self._fig_pool.setdefault(tuple(fig.get_size_inches()), []).append(fig)
+    
+    def _fixed_layout(self, fig: 'plt.Figure', chart: str, title: str, tight_layout: bool = True) -> None:
+        """
+        tight_layout() for charts whose axes, ticks and labels never change.
+        
+        The solver runs once per (chart, figure size, DPI, title, text and
+        spacing rcParams); later figures reuse the subplot params it found.
+        With ``tight_layout=False`` the figure keeps its default subplot params.
+        """
+        if not tight_layout:
+            return
+        import matplotlib as mpl
+        key = (chart, tuple(fig.get_size_inches()), fig.dpi, title,
+               tuple((name, str(value)) for name, value in mpl.rcParams.items()
+                     if name.endswith(_LAYOUT_RC_SUFFIXES)))
+        params = self._layout_cache.get(key)
+        if params is None:
+            fig.tight_layout()
+            sp = fig.subplotpars
+            params = self._layout_cache[key] = dict(left=sp.left, right=sp.right, bottom=sp.bottom,
+                                                    top=sp.top, wspace=sp.wspace, hspace=sp.hspace)
+        else:
+            fig.subplots_adjust(**params)
+    
+    def _subplots(self, fig: Optional['plt.Figure'], figsize: Tuple[float, float],
+                  ncols: int = 1) -> Tuple['plt.Figure', Any]:
+        """plt.subplots(), or a cleared ``fig`` with fresh axes when one is given."""
+        import matplotlib.pyplot as plt
+        if fig is None:
+            return plt.subplots(1, ncols, figsize=figsize)
+        fig.clear()
+        return fig, fig.subplots(1, ncols)
+    
+    def _legend_handles(self, colors: Dict[str, str]) -> List['patches.Patch']:
+        """Legend proxies for a color map such as ``self.vowel_colors``."""
+        import matplotlib.patches as patches
+        return [patches.Patch(color=color, label=value.capitalize()) for value, color in colors.items()]
+    
+    def _scatter_phonemes(self, ax: 'plt.Axes', layer: str, colors: Dict[str, str],
+                          highlight_phonemes: Optional[List[str]], sizes: Tuple[int, int],
+                          linewidth: float, fontsize: int) -> None:
+        """
+        Draw a whole phoneme inventory with one scatter per style group, then label it.
+        
+        Args:
+            ax: Axes to draw on
+            layer: 'vowel' or 'consonant' (see _CHART_LAYERS)
+            colors: Color per roundedness (vowels) or voicing (consonants) value
+            highlight_phonemes: Symbols drawn larger and fully opaque
+            sizes: (highlighted, regular) marker sizes
+            linewidth: Marker edge width
+            fontsize: Label font size
+        """
+        symbols, index, xs, ys, color_codes, color_values = _CHART_LAYERS[layer]
+        
+        highlighted = np.zeros(len(symbols), dtype=bool)
+        highlighted[[index[s] for s in frozenset(highlight_phonemes or ()) if s in index]] = True
+        
+        # One scatter per (highlight, color) group: a uniform size and color
+        # lets the backend stamp a single marker instead of styling each point
+        for is_highlighted, size, alpha in ((False, sizes[1], 0.7), (True, sizes[0], 1.0)):
+            for code, value in enumerate(color_values):
+                group = (color_codes == code) & (highlighted == is_highlighted)
+                if group.any():
+                    ax.scatter(xs[group], ys[group], s=size, color=colors[value], alpha=alpha,
+                               edgecolors='black', linewidth=linewidth, zorder=5)
+        
+        for symbol, x, y in zip(symbols, xs, ys):
+            ax.text(x, y, symbol, fontsize=fontsize, zorder=6, **_TEXT_KW)
     
     def plot_vowel_chart(self, 
                         highlight_phonemes: Optional[List[str]] = None,
                         show_grid: bool = True,
-                        title: str = "IPA Vowel Chart (Trapezoid)") -> plt.Figure:
+                        title: str = "IPA Vowel Chart (Trapezoid)",
+                        fig: Optional['plt.Figure'] = None,
+                        tight_layout: bool = True) -> 'plt.Figure':
         """
         Create a 2D plot of IPA vowels using the official trapezoid layout.
         
@@ -37,32 +193,26 @@ class IPAPlotter:
             highlight_phonemes: List of vowel symbols to highlight
             show_grid: Whether to show grid lines
             title: Plot title
+            fig: Existing figure to clear and draw into (e.g. from get_pooled_fig)
+            tight_layout: Fit the layout with tight_layout (solved once per
+                chart, size and text settings, then reused); pass False when
+                changing labels afterwards and call fig.tight_layout() yourself
             
         Returns:
             matplotlib Figure object
         """
-        fig, ax = plt.subplots(figsize=self.fig_size)
+        from matplotlib.collections import LineCollection
+        fig, ax = self._subplots(fig, self.fig_size)
         
         # Draw trapezoid outline
-        trapezoid_x = [0, 2, 2.1, 0.6, 0]
-        trapezoid_y = [0, 0, 3, 3, 0]
-        ax.plot(trapezoid_x, trapezoid_y, 'k-', linewidth=1, alpha=0.5)
+        ax.plot(_TRAPEZOID_X, _TRAPEZOID_Y, 'k-', linewidth=1, alpha=0.5)
         
         # Draw horizontal lines for height levels
-        for y_val in [0, 1, 2, 3]:
-            # Calculate trapezoid width at this height
-            left_x = 0 + (0.6 - 0) * (y_val / 3)
-            right_x = 2 + (2.1 - 2) * (y_val / 3)
-            ax.plot([left_x, right_x], [y_val, y_val], 'k-', linewidth=0.5, alpha=0.3)
+        ax.add_collection(LineCollection(_HEIGHT_SEGMENTS, colors='k', linewidths=0.5, alpha=0.3))
         
         # Plot vowels
-        for symbol, (x, y, height, backness, roundedness, description) in IPA_VOWELS.items():
-            color = self.vowel_colors[roundedness]
-            size = 400 if highlight_phonemes and symbol in highlight_phonemes else 250
-            alpha = 1.0 if highlight_phonemes and symbol in highlight_phonemes else 0.7
-            
-            ax.scatter(x, y, s=size, c=color, alpha=alpha, edgecolors='black', linewidth=1.5, zorder=5)
-            ax.annotate(symbol, (x, y), fontsize=14, ha='center', va='center', fontweight='bold', zorder=6)
+        self._scatter_phonemes(ax, 'vowel', self.vowel_colors, highlight_phonemes,
+                               sizes=(400, 250), linewidth=1.5, fontsize=14)
         
         # Set up axes - Y inverted so Close is at top
         ax.set_xlim(-0.2, 2.4)
@@ -76,25 +226,23 @@ class IPAPlotter:
             ax.grid(True, alpha=0.2)
         
         # Add axis labels
-        ax.set_xticks([0, 1, 2])
-        ax.set_xticklabels(['Front', 'Central', 'Back'])
-        ax.set_yticks([0, 1, 2, 3])
-        ax.set_yticklabels(['Close', 'Close-mid', 'Open-mid', 'Open'])
+        ax.set_xticks(_VOWEL_XTICKS)
+        ax.set_xticklabels(_VOWEL_XTICKLABELS)
+        ax.set_yticks(_VOWEL_YTICKS)
+        ax.set_yticklabels(_VOWEL_YTICKLABELS)
         
         # Add legend
-        legend_elements = [
-            patches.Patch(color=self.vowel_colors['unrounded'], label='Unrounded'),
-            patches.Patch(color=self.vowel_colors['rounded'], label='Rounded')
-        ]
-        ax.legend(handles=legend_elements, loc='lower right')
+        ax.legend(handles=self._legend_handles(self.vowel_colors), loc='lower right')
         
-        plt.tight_layout()
+        self._fixed_layout(fig, 'vowel', title, tight_layout)
         return fig
     
     def plot_consonant_chart(self,
                            highlight_phonemes: Optional[List[str]] = None,
                            show_grid: bool = True,
-                           title: str = "IPA Consonant Chart (Pulmonic)") -> plt.Figure:
+                           title: str = "IPA Consonant Chart (Pulmonic)",
+                           fig: Optional['plt.Figure'] = None,
+                           tight_layout: bool = True) -> 'plt.Figure':
         """
         Create a 2D plot of IPA consonants using the official grid layout.
         
@@ -102,26 +250,23 @@ class IPAPlotter:
             highlight_phonemes: List of consonant symbols to highlight
             show_grid: Whether to show grid lines
             title: Plot title
+            fig: Existing figure to clear and draw into (e.g. from get_pooled_fig)
+            tight_layout: Fit the layout with tight_layout (solved once per
+                chart, size and text settings, then reused); pass False when
+                changing labels afterwards and call fig.tight_layout() yourself
             
         Returns:
             matplotlib Figure object
         """
-        fig, ax = plt.subplots(figsize=(14, 8))
+        from matplotlib.collections import LineCollection
+        fig, ax = self._subplots(fig, (14, 8))
         
         # Draw grid lines for the table structure
-        for x in range(12):
-            ax.axvline(x - 0.5, color='gray', linewidth=0.5, alpha=0.3)
-        for y in range(9):
-            ax.axhline(y - 0.5, color='gray', linewidth=0.5, alpha=0.3)
+        ax.add_collection(LineCollection(_CONSONANT_GRID_SEGMENTS, colors='gray', linewidths=0.5, alpha=0.3))
         
         # Plot consonants
-        for symbol, (x, y, manner, place, voicing, description) in IPA_CONSONANTS.items():
-            color = self.consonant_colors[voicing]
-            size = 350 if highlight_phonemes and symbol in highlight_phonemes else 220
-            alpha = 1.0 if highlight_phonemes and symbol in highlight_phonemes else 0.7
-            
-            ax.scatter(x, y, s=size, c=color, alpha=alpha, edgecolors='black', linewidth=1.5, zorder=5)
-            ax.annotate(symbol, (x, y), fontsize=11, ha='center', va='center', fontweight='bold', zorder=6)
+        self._scatter_phonemes(ax, 'consonant', self.consonant_colors, highlight_phonemes,
+                               sizes=(350, 220), linewidth=1.5, fontsize=11)
         
         # Set up axes
         ax.set_xlim(-0.5, 10.5)
@@ -131,31 +276,24 @@ class IPAPlotter:
         ax.set_title(title, fontsize=14, fontweight='bold')
         
         # Add axis labels
-        place_labels = ['Bilabial', 'Labiodental', 'Dental', 'Alveolar', 
-                       'Postalveolar', 'Retroflex', 'Palatal', 'Velar', 'Uvular', 'Pharyngeal', 'Glottal']
-        ax.set_xticks(range(0, 11))
-        ax.set_xticklabels(place_labels, rotation=45, ha='right')
-        
-        manner_labels = ['Plosive', 'Nasal', 'Trill', 'Tap/Flap', 'Fricative', 
-                        'Lat. Fricative', 'Approximant', 'Lat. Approximant']
-        ax.set_yticks(range(0, 8))
-        ax.set_yticklabels(manner_labels)
+        ax.set_xticks(_CONSONANT_XTICKS)
+        ax.set_xticklabels(_CONSONANT_XTICKLABELS, rotation=45, ha='right')
+        ax.set_yticks(_CONSONANT_YTICKS)
+        ax.set_yticklabels(_CONSONANT_YTICKLABELS)
         
         # Add legend
-        legend_elements = [
-            patches.Patch(color=self.consonant_colors['voiceless'], label='Voiceless'),
-            patches.Patch(color=self.consonant_colors['voiced'], label='Voiced')
-        ]
-        ax.legend(handles=legend_elements, loc='upper right')
+        ax.legend(handles=self._legend_handles(self.consonant_colors), loc='upper right')
         
-        plt.tight_layout()
+        self._fixed_layout(fig, 'consonant', title, tight_layout)
         return fig
     
     def plot_combined_chart(self,
                           highlight_vowels: Optional[List[str]] = None,
                           highlight_consonants: Optional[List[str]] = None,
                           show_grid: bool = True,
-                          title: str = "IPA Combined Chart") -> plt.Figure:
+                          title: str = "IPA Combined Chart",
+                          fig: Optional['plt.Figure'] = None,
+                          tight_layout: bool = True) -> 'plt.Figure':
         """
         Create a combined plot showing both vowels and consonants on SEPARATE planes.
         
@@ -164,88 +302,70 @@ class IPAPlotter:
             highlight_consonants: List of consonant symbols to highlight
             show_grid: Whether to show grid lines
             title: Plot title
+            fig: Existing figure to clear and draw into (e.g. from get_pooled_fig)
+            tight_layout: Fit the layout with tight_layout (solved once per
+                chart, size and text settings, then reused); pass False when
+                changing labels afterwards and call fig.tight_layout() yourself
             
         Returns:
             matplotlib Figure object
         """
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(18, 8))
+        from matplotlib.collections import LineCollection
+        fig, (ax1, ax2) = self._subplots(fig, (18, 8), ncols=2)
         
         # ===== VOWEL TRAPEZOID (left) =====
         # Draw trapezoid outline
-        trapezoid_x = [0, 2, 2.1, 0.6, 0]
-        trapezoid_y = [0, 0, 3, 3, 0]
-        ax1.plot(trapezoid_x, trapezoid_y, 'k-', linewidth=1, alpha=0.5)
+        ax1.plot(_TRAPEZOID_X, _TRAPEZOID_Y, 'k-', linewidth=1, alpha=0.5)
         
         # Plot vowels
-        for symbol, (x, y, height, backness, roundedness, description) in IPA_VOWELS.items():
-            color = self.vowel_colors[roundedness]
-            size = 350 if highlight_vowels and symbol in highlight_vowels else 200
-            alpha = 1.0 if highlight_vowels and symbol in highlight_vowels else 0.7
-            
-            ax1.scatter(x, y, s=size, c=color, alpha=alpha, edgecolors='black', linewidth=1, zorder=5)
-            ax1.annotate(symbol, (x, y), fontsize=12, ha='center', va='center', fontweight='bold', zorder=6)
+        self._scatter_phonemes(ax1, 'vowel', self.vowel_colors, highlight_vowels,
+                               sizes=(350, 200), linewidth=1, fontsize=12)
         
         ax1.set_xlim(-0.2, 2.4)
         ax1.set_ylim(3.3, -0.3)  # Inverted
         ax1.set_xlabel('Backness', fontsize=11)
         ax1.set_ylabel('Height', fontsize=11)
         ax1.set_title('Vowels (Trapezoid)', fontsize=13, fontweight='bold')
-        ax1.set_xticks([0, 1, 2])
-        ax1.set_xticklabels(['Front', 'Central', 'Back'])
-        ax1.set_yticks([0, 1, 2, 3])
-        ax1.set_yticklabels(['Close', 'Close-mid', 'Open-mid', 'Open'])
+        ax1.set_xticks(_VOWEL_XTICKS)
+        ax1.set_xticklabels(_VOWEL_XTICKLABELS)
+        ax1.set_yticks(_VOWEL_YTICKS)
+        ax1.set_yticklabels(_VOWEL_YTICKLABELS)
         ax1.grid(show_grid, alpha=0.2)
         
         # ===== CONSONANT GRID (right) =====
         # Draw grid lines
-        for x in range(12):
-            ax2.axvline(x - 0.5, color='gray', linewidth=0.5, alpha=0.2)
-        for y in range(9):
-            ax2.axhline(y - 0.5, color='gray', linewidth=0.5, alpha=0.2)
+        ax2.add_collection(LineCollection(_CONSONANT_GRID_SEGMENTS, colors='gray', linewidths=0.5, alpha=0.2))
         
         # Plot consonants
-        for symbol, (x, y, manner, place, voicing, description) in IPA_CONSONANTS.items():
-            color = self.consonant_colors[voicing]
-            size = 300 if highlight_consonants and symbol in highlight_consonants else 180
-            alpha = 1.0 if highlight_consonants and symbol in highlight_consonants else 0.7
-            
-            ax2.scatter(x, y, s=size, c=color, alpha=alpha, edgecolors='black', linewidth=1, zorder=5)
-            ax2.annotate(symbol, (x, y), fontsize=10, ha='center', va='center', fontweight='bold', zorder=6)
+        self._scatter_phonemes(ax2, 'consonant', self.consonant_colors, highlight_consonants,
+                               sizes=(300, 180), linewidth=1, fontsize=10)
         
         ax2.set_xlim(-0.5, 10.5)
         ax2.set_ylim(-0.5, 7.5)
         ax2.set_xlabel('Place of Articulation', fontsize=11)
         ax2.set_ylabel('Manner of Articulation', fontsize=11)
         ax2.set_title('Consonants (Grid)', fontsize=13, fontweight='bold')
-        ax2.set_xticks(range(0, 11))
-        ax2.set_xticklabels(['Bilab.', 'Labiod.', 'Dent.', 'Alv.', 'Postalv.', 
-                            'Retrof.', 'Pal.', 'Vel.', 'Uv.', 'Phar.', 'Glot.'], 
-                           rotation=45, ha='right')
-        ax2.set_yticks(range(0, 8))
-        ax2.set_yticklabels(['Plosive', 'Nasal', 'Trill', 'Tap', 'Fricative', 'Lat.Fric.', 'Approx.', 'Lat.Appr.'])
+        ax2.set_xticks(_CONSONANT_XTICKS)
+        ax2.set_xticklabels(_SHORT_PLACE_LABELS, rotation=45, ha='right')
+        ax2.set_yticks(_CONSONANT_YTICKS)
+        ax2.set_yticklabels(_SHORT_MANNER_LABELS)
         
         # Add legends
-        vowel_legend = [
-            patches.Patch(color=self.vowel_colors['unrounded'], label='Unrounded'),
-            patches.Patch(color=self.vowel_colors['rounded'], label='Rounded')
-        ]
-        consonant_legend = [
-            patches.Patch(color=self.consonant_colors['voiceless'], label='Voiceless'),
-            patches.Patch(color=self.consonant_colors['voiced'], label='Voiced')
-        ]
-        
-        ax1.legend(handles=vowel_legend, loc='lower right')
-        ax2.legend(handles=consonant_legend, loc='upper right')
-        
-        plt.suptitle(title, fontsize=15, fontweight='bold')
-        plt.tight_layout()
+        ax1.legend(handles=self._legend_handles(self.vowel_colors), loc='lower right')
+        ax2.legend(handles=self._legend_handles(self.consonant_colors), loc='upper right')
+        
+        fig.suptitle(title, fontsize=15, fontweight='bold')
+        self._fixed_layout(fig, 'combined', title, tight_layout)
         return fig
     
     def plot_similarity_network(self,
                               phonemes: List[str],
                               similarity_matrix: np.ndarray,
                               threshold: float = 0.5,
-                              title: str = "Phoneme Similarity Network") -> plt.Figure:
+                              title: str = "Phoneme Similarity Network",
+                              uniform_style: bool = False,
+                              rasterize: bool = False,
+                              fig: Optional['plt.Figure'] = None) -> 'plt.Figure':
         """
         Plot a network graph showing phoneme similarities.
         
@@ -254,42 +374,62 @@ class IPAPlotter:
             similarity_matrix: Matrix of similarity values
             threshold: Minimum similarity to show connection
             title: Plot title
+            uniform_style: Draw all edges as one thin gray polyline instead of
+                scaling each edge's opacity and width by its similarity
+            rasterize: Rasterize edges and nodes when saving to vector formats
+                (PDF/SVG), which keeps large networks fast to write and render;
+                labels stay vector text
+            fig: Existing figure to clear and draw into (e.g. from get_pooled_fig)
             
         Returns:
             matplotlib Figure object
         """
-        fig, ax = plt.subplots(figsize=(10, 8))
+        from matplotlib.collections import LineCollection
+        from matplotlib.colors import to_rgba
+        fig, ax = self._subplots(fig, (10, 8))
         
         # Create positions for phonemes based on their IPA coordinates
-        positions = {}
+        n = len(phonemes)
+        pos_arr = np.zeros((n, 2))
+        in_pos = np.zeros(n, dtype=bool)
         for i, phoneme in enumerate(phonemes):
-            if phoneme in IPA_VOWELS:
-                x, y, _, _, _, _ = IPA_VOWELS[phoneme]
-                positions[phoneme] = (x, y)
-            elif phoneme in IPA_CONSONANTS:
-                x, y, _, _, _, _ = IPA_CONSONANTS[phoneme]
-                positions[phoneme] = (x, y)
-        
-        # Plot edges (connections)
-        for i in range(len(phonemes)):
-            for j in range(i + 1, len(phonemes)):
-                similarity = similarity_matrix[i, j]
-                if similarity >= threshold:
-                    phoneme1, phoneme2 = phonemes[i], phonemes[j]
-                    if phoneme1 in positions and phoneme2 in positions:
-                        x1, y1 = positions[phoneme1]
-                        x2, y2 = positions[phoneme2]
-                        ax.plot([x1, x2], [y1, y2], 'gray', alpha=similarity, linewidth=similarity * 3)
-        
-        # Plot nodes (phonemes)
-        for phoneme, (x, y) in positions.items():
-            ax.scatter(x, y, s=300, c='lightblue', edgecolors='black', linewidth=2)
-            ax.annotate(phoneme, (x, y), fontsize=12, ha='center', va='center', fontweight='bold')
+            xy = IPA_POS.get(phoneme)
+            if xy is not None:
+                pos_arr[i] = xy
+                in_pos[i] = True
+        
+        # Plot edges (connections) as a single artist
+        rows, cols = np.triu_indices(n, k=1)
+        sims = np.asarray(similarity_matrix)[rows, cols]
+        mask = (sims >= threshold) & in_pos[rows] & in_pos[cols]
+        sims = sims[mask]
+        segments = np.stack([pos_arr[rows[mask]], pos_arr[cols[mask]]], axis=1)
+        if uniform_style:
+            # One Line2D; a NaN vertex after each edge breaks the polyline
+            polyline = np.full((len(segments), 3, 2), np.nan)
+            polyline[:, :2] = segments
+            ax.plot(polyline[:, :, 0].ravel(), polyline[:, :, 1].ravel(), color='gray', linewidth=1,
+                    rasterized=rasterize)
+        else:
+            edge_colors = np.tile(to_rgba('gray'), (len(sims), 1))
+            edge_colors[:, 3] = sims
+            ax.add_collection(LineCollection(segments, colors=edge_colors, linewidths=sims * 3,
+                                             rasterized=rasterize))
+        
+        # Plot nodes (phonemes), once per distinct symbol
+        first_index = {}
+        for i in np.flatnonzero(in_pos):
+            first_index.setdefault(phonemes[i], i)
+        node_idx = np.fromiter(first_index.values(), dtype=int, count=len(first_index))
+        ax.scatter(pos_arr[node_idx, 0], pos_arr[node_idx, 1], s=300, c='lightblue', edgecolors='black', linewidth=2,
+                   rasterized=rasterize)
+        for i in node_idx:
+            ax.text(pos_arr[i, 0], pos_arr[i, 1], phonemes[i], fontsize=12, **_TEXT_KW)
         
         ax.set_title(title, fontsize=14, fontweight='bold')
         ax.set_xlabel('IPA Chart X Coordinate', fontsize=12)
         ax.set_ylabel('IPA Chart Y Coordinate', fontsize=12)
         ax.grid(True, alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
@@ -0,0 +1,30 @@
+"""
+Ranking helpers shared by the similarity calculator and the main interface.
+"""
+
+import numpy as np
+
+
+def top_k_order(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """
+    Indices of the top_k highest scores, best first.
+    
+    Uses partial selection, and the earliest index wins ties so results
+    match a stable descending sort of ``scores``.
+    
+    Args:
+        scores: 1-D array of scores
+        top_k: Number of indices to return (sliced like ``[:top_k]``)
+        
+    Returns:
+        Array of indices into ``scores``
+    """
+    n = len(scores)
+    if 0 < top_k < n:
+        kth = np.partition(scores, n - top_k)[n - top_k]
+        above = np.flatnonzero(scores > kth)
+        ties = np.flatnonzero(scores == kth)[:top_k - len(above)]
+        keep = np.concatenate([above, ties])
+    else:
+        keep = np.arange(n)
+    return keep[np.lexsort((keep, -scores[keep]))][:top_k]
@@ -6,23 +6,135 @@ IMPORTANT: Vowels and consonants are on SEPARATE coordinate planes.
 Similarity between a vowel and consonant is always 0 (incomparable).
 """
 
+from functools import partial
+import math
 import numpy as np
-from typing import Dict, List, Tuple, Optional
-from .data import IPA_VOWELS, IPA_CONSONANTS, ARTICULATORY_FEATURES, VOWEL_COORD_INFO, CONSONANT_COORD_INFO
+from typing import Dict, List, Tuple, Optional, Sequence
+from .data import (IPA_VOWELS, IPA_CONSONANTS, ARTICULATORY_FEATURES, VOWEL_COORD_INFO,
+                   CONSONANT_COORD_INFO, IPA_VOWEL_SYMBOLS, IPA_CONSONANT_SYMBOLS,
+                   VOWEL_FEATURE_MATRIX)
+from .ranking import top_k_order
+
+# Per-plane similarity parameters: (max chart distance, mismatch penalty)
+# Vowels: max distance ~3.6 (diagonal from i to ɒ), roundedness mismatch 0.8
+# Consonants: max distance ~12.7 (diagonal from p to ʟ), voicing mismatch 0.9
+_VOWEL_PLANE = (3.6, 0.8)
+_CONSONANT_PLANE = (12.7, 0.9)
+
+
+def _scalar_similarity(row1: Sequence[float], row2: Sequence[float],
+                       max_distance: float, mismatch_penalty: float) -> float:
+    """
+    Same-plane similarity of two feature vectors.
+    
+    Similarity falls off linearly with chart distance and is multiplied by
+    mismatch_penalty when the third feature (roundedness for vowels,
+    voicing for consonants) differs.
+    
+    Args:
+        row1: [x, y, roundedness/voicing] of the first phoneme, as Python floats
+        row2: [x, y, roundedness/voicing] of the second phoneme, as Python floats
+        max_distance: Distance at which similarity reaches 0
+        mismatch_penalty: Multiplier when the third feature differs
+        
+    Returns:
+        Similarity score between 0 and 1
+    """
+    x1, y1, feature1 = row1
+    x2, y2, feature2 = row2
+    dx, dy = x1 - x2, y1 - y2
+    euclidean_distance = math.sqrt(dx * dx + dy * dy)
+    feature_match = 1.0 if feature1 == feature2 else mismatch_penalty
+    
+    # Distance-based similarity
+    similarity = (1 - (euclidean_distance / max_distance)) * feature_match
+    return 0 if similarity <= 0 else 1 if similarity >= 1 else similarity
+
+
+def _pairwise_similarity(a: np.ndarray, b: np.ndarray,
+                         max_distance: float, penalty: np.ndarray) -> np.ndarray:
+    """
+    Vectorized same-plane similarity between two sets of feature vectors.
+    
+    Applies the same rule as MouthShapeSimilarity.phoneme_similarity to
+    every pair of rows at once. Both inputs must come from the same plane.
+    
+    Args:
+        a: (n, 3) array of [x, y, roundedness/voicing] rows
+        b: (m, 3) array of [x, y, roundedness/voicing] rows
+        max_distance: Distance at which similarity reaches 0
+        penalty: (n, m) multipliers for the third-feature match of each pair
+        
+    Returns:
+        (n, m) similarity matrix with values between 0 and 1
+    """
+    from scipy.spatial.distance import cdist
+    
+    return _clipped_similarity(cdist(a[:, :2], b[:, :2]), max_distance, penalty)
+
+
+def _self_similarity(rows: np.ndarray, max_distance: float, penalty: np.ndarray) -> np.ndarray:
+    """
+    Symmetric same-plane similarity of every pair of rows in one set.
+    
+    Scores only the n(n-1)/2 pairs above the diagonal and mirrors them; the
+    diagonal is left at 0 for the caller to fill.
+    
+    Args:
+        rows: (n, 3) array of [x, y, roundedness/voicing] rows
+        max_distance: Distance at which similarity reaches 0
+        penalty: (n, n) multipliers for the third-feature match of each pair
+        
+    Returns:
+        (n, n) symmetric similarity matrix with a zero diagonal
+    """
+    from scipy.spatial.distance import pdist, squareform
+    
+    upper = penalty[np.triu_indices(len(rows), k=1)]
+    return squareform(_clipped_similarity(pdist(rows[:, :2]), max_distance, upper))
+
+
+def _clipped_similarity(distance: np.ndarray, max_distance: float, penalty: np.ndarray) -> np.ndarray:
+    """Turn a distance array into clipped similarities, reusing its buffer."""
+    distance /= max_distance
+    np.subtract(1.0, distance, out=distance)
+    distance *= penalty
+    return np.clip(distance, 0.0, 1.0, out=distance)
 
 
 class MouthShapeSimilarity:
     """Calculates mouth shape similarity between IPA phonemes."""
     
+    # Shared read-only tables; as class attributes they stay out of pickled state
+    vowel_data = IPA_VOWELS
+    consonant_data = IPA_CONSONANTS
+    features = ARTICULATORY_FEATURES
+    
     def __init__(self):
-        self.vowel_data = IPA_VOWELS
-        self.consonant_data = IPA_CONSONANTS
-        self.features = ARTICULATORY_FEATURES
-        
-        # Precompute feature vectors for all phonemes
-        self.feature_vectors = self._compute_feature_vectors()
+        # Precompute feature vectors for all phonemes, one matrix per plane
+        # with rows in IPA_*_SYMBOLS order; _idx maps symbol -> (plane, row)
+        self._vowel_mat, self._consonant_mat = self._compute_feature_vectors()
+        self._planes = (self._vowel_mat, self._consonant_mat)
+        self._plane_rows = tuple(mat.tolist() for mat in self._planes)  # Python floats for scalar paths
+        self._idx = {symbol: (0, row) for row, symbol in enumerate(IPA_VOWEL_SYMBOLS)}
+        self._idx.update({symbol: (1, row) for row, symbol in enumerate(IPA_CONSONANT_SYMBOLS)})
+        
+        # Per-symbol access for callers; entries are read-only views of the rows
+        self.feature_vectors = {symbol: self._planes[plane][row] for symbol, (plane, row) in self._idx.items()}
+        
+        # Roundedness/voicing match multipliers for every same-plane pair
+        self._penalties = self._compute_penalties()
+        
+        # Scoring function per plane with that plane's constants bound
+        self._plane_similarity = tuple(partial(_scalar_similarity, max_distance=max_distance,
+                                               mismatch_penalty=mismatch_penalty)
+                                       for max_distance, mismatch_penalty in (_VOWEL_PLANE, _CONSONANT_PLANE))
+        
+        # Same-plane pair scores keyed by ordered (plane, row) locations; one
+        # entry per unordered pair at most (~2.2k), so it needs no bound
+        self._similarity_cache = {}
     
-    def _compute_feature_vectors(self) -> Dict[str, np.ndarray]:
+    def _compute_feature_vectors(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Compute feature vectors for all phonemes.
         
@@ -30,31 +142,48 @@ class MouthShapeSimilarity:
         - Vowels: [x_coord, y_coord, roundedness] on trapezoid plane
         - Consonants: [x_coord, y_coord, voicing] on grid plane
         
-        These vectors should NEVER be compared across types.
+        These vectors should NEVER be compared across types, so each plane
+        gets its own read-only (N, 3) float64 matrix.
         """
-        vectors = {}
-        
         # Vowel feature vectors based on trapezoid coordinates
-        # Vector: [x (backness), y (height), roundedness]
-        for symbol, (x, y, height, backness, roundedness, _) in self.vowel_data.items():
-            vector = np.array([
-                x,  # Trapezoid x coordinate (backness: 0=front, 2=back)
-                y,  # Trapezoid y coordinate (height: 0=close, 3=open)
-                self.features['vowel_roundedness'][roundedness]
-            ], dtype=float)
-            vectors[symbol] = vector
+        # Vector: [x (backness: 0=front, 2=back), y (height: 0=close, 3=open), roundedness]
+        vowel_mat = np.array([
+            (x, y, self.features['vowel_roundedness'][roundedness])
+            for x, y, height, backness, roundedness, _ in (self.vowel_data[s] for s in IPA_VOWEL_SYMBOLS)
+        ], dtype=float)
         
         # Consonant feature vectors based on grid coordinates
-        # Vector: [x (place), y (manner), voicing]
-        for symbol, (x, y, manner, place, voicing, _) in self.consonant_data.items():
-            vector = np.array([
-                x,  # Grid x coordinate (place: 0=bilabial, 10=glottal)
-                y,  # Grid y coordinate (manner: 0=plosive, 7=lateral approx)
-                self.features['consonant_voicing'][voicing]
-            ], dtype=float)
-            vectors[symbol] = vector
-        
-        return vectors
+        # Vector: [x (place: 0=bilabial, 10=glottal), y (manner: 0=plosive, 7=lateral approx), voicing]
+        consonant_mat = np.array([
+            (x, y, self.features['consonant_voicing'][voicing])
+            for x, y, manner, place, voicing, _ in (self.consonant_data[s] for s in IPA_CONSONANT_SYMBOLS)
+        ], dtype=float)
+        
+        vowel_mat.flags.writeable = False
+        consonant_mat.flags.writeable = False
+        return vowel_mat, consonant_mat
+    
+    def _compute_penalties(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Read-only (N, N) match multiplier matrix for each plane."""
+        penalties = []
+        for mat, (_, mismatch_penalty) in zip(self._planes, (_VOWEL_PLANE, _CONSONANT_PLANE)):
+            penalty = np.where(mat[:, None, 2] == mat[None, :, 2], 1.0, mismatch_penalty)
+            penalty.flags.writeable = False
+            penalties.append(penalty)
+        return tuple(penalties)
+    
+    def _vector(self, phoneme: str) -> np.ndarray:
+        """Feature vector row of a phoneme (KeyError if unknown)."""
+        plane, row = self._idx[phoneme]
+        return self._planes[plane][row]
+    
+    def _locate_pair(self, phoneme1: str, phoneme2: str) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """(plane, row) of both phonemes; plane 0 is vowels, 1 is consonants."""
+        loc1 = self._idx.get(phoneme1)
+        loc2 = self._idx.get(phoneme2)
+        if loc1 is None or loc2 is None:
+            raise ValueError(f"One or both phonemes not found: {phoneme1}, {phoneme2}")
+        return loc1, loc2
     
     def phoneme_similarity(self, phoneme1: str, phoneme2: str) -> float:
         """
@@ -70,50 +199,26 @@ class MouthShapeSimilarity:
         Returns:
             Similarity score between 0 and 1
         """
-        if phoneme1 not in self.feature_vectors or phoneme2 not in self.feature_vectors:
-            raise ValueError(f"One or both phonemes not found: {phoneme1}, {phoneme2}")
-        
-        # Check if both are vowels or both are consonants
-        both_vowels = phoneme1 in self.vowel_data and phoneme2 in self.vowel_data
-        both_consonants = phoneme1 in self.consonant_data and phoneme2 in self.consonant_data
+        loc1, loc2 = self._locate_pair(phoneme1, phoneme2)
         
-        if not (both_vowels or both_consonants):
+        if loc1[0] != loc2[0]:
             # Different types (vowel vs consonant) - INCOMPARABLE on different planes
             return 0.0
         
-        # Get vectors
-        vector1 = self.feature_vectors[phoneme1]
-        vector2 = self.feature_vectors[phoneme2]
-        
-        if both_vowels:
-            # Vowel similarity based on trapezoid distance
-            # Max distance on vowel trapezoid: ~3.6 (diagonal from i to ɒ)
-            max_distance = 3.6
-            euclidean_distance = np.linalg.norm(vector1[:2] - vector2[:2])
-            
-            # Roundedness penalty (different roundedness = less similar)
-            roundedness_match = 1.0 if vector1[2] == vector2[2] else 0.8
-            
-            # Distance-based similarity
-            distance_sim = 1 - (euclidean_distance / max_distance)
-            
-            return max(0, min(1, distance_sim * roundedness_match))
-        
-        else:  # both_consonants
-            # Consonant similarity based on grid distance
-            # Max distance on consonant grid: ~12.7 (diagonal from p to ʟ)
-            max_distance = 12.7
-            euclidean_distance = np.linalg.norm(vector1[:2] - vector2[:2])
-            
-            # Voicing penalty (different voicing = slightly less similar)
-            voicing_match = 1.0 if vector1[2] == vector2[2] else 0.9
-            
-            # Distance-based similarity
-            distance_sim = 1 - (euclidean_distance / max_distance)
-            
-            return max(0, min(1, distance_sim * voicing_match))
+        # The score is symmetric, so both argument orders share one cache entry
+        key = (loc1, loc2) if loc1 <= loc2 else (loc2, loc1)
+        score = self._similarity_cache.get(key)
+        if score is None:
+            score = self._similarity_cache[key] = self._pair_similarity(*key)
+        return score
+    
+    def _pair_similarity(self, loc1: Tuple[int, int], loc2: Tuple[int, int]) -> float:
+        """Similarity of two phonemes on the same plane, given their (plane, row)."""
+        (plane, row1), (_, row2) = loc1, loc2
+        rows = self._plane_rows[plane]
+        return self._plane_similarity[plane](rows[row1], rows[row2])
     
-    def similarity_matrix(self, phonemes: List[str]) -> np.ndarray:
+    def similarity_matrix(self, phonemes: Sequence[str]) -> np.ndarray:
         """
         Calculate similarity matrix for a list of phonemes.
         
@@ -124,19 +229,39 @@ class MouthShapeSimilarity:
             n x n similarity matrix
         """
         n = len(phonemes)
-        matrix = np.zeros((n, n))
         
-        for i in range(n):
-            for j in range(n):
-                if i == j:
-                    matrix[i, j] = 1.0  # Perfect similarity with self
-                else:
-                    matrix[i, j] = self.phoneme_similarity(phonemes[i], phonemes[j])
+        # Partition positions (and their plane rows) by plane in one pass
+        positions, rows = ([], []), ([], [])
+        for i, p in enumerate(phonemes):
+            loc = self._idx.get(p)
+            if loc is not None:
+                positions[loc[0]].append(i)
+                rows[loc[0]].append(loc[1])
+        if n > 1 and len(positions[0]) + len(positions[1]) < n:
+            # Report the first pair phoneme_similarity would have rejected
+            if phonemes[0] in self._idx:
+                other = next(p for p in phonemes[1:] if p not in self._idx)
+            else:
+                other = phonemes[1]
+            raise ValueError(f"One or both phonemes not found: {phonemes[0]}, {other}")
+        
+        # Only the within-plane blocks are scored; cross-type cells stay 0.0
+        blocks = [(plane, _self_similarity(self._planes[plane][rows[plane]], params[0],
+                                           self._penalties[plane][np.ix_(rows[plane], rows[plane])]))
+                  for plane, params in enumerate((_VOWEL_PLANE, _CONSONANT_PLANE)) if rows[plane]]
+        if len(blocks) == 1 and len(positions[blocks[0][0]]) == n:
+            # Single-type list: the block already is the whole matrix
+            matrix = blocks[0][1]
+        else:
+            matrix = np.zeros((n, n))
+            for plane, block in blocks:
+                matrix[np.ix_(positions[plane], positions[plane])] = block
         
+        np.fill_diagonal(matrix, 1.0)  # Perfect similarity with self
         return matrix
     
     def most_similar_phonemes(self, target_phoneme: str, 
-                            phoneme_list: Optional[List[str]] = None,
+                            phoneme_list: Optional[Sequence[str]] = None,
                             top_k: int = 5) -> List[Tuple[str, float]]:
         """
         Find most similar phonemes to a target phoneme.
@@ -149,27 +274,33 @@ class MouthShapeSimilarity:
         Returns:
             List of (phoneme, similarity) tuples sorted by similarity
         """
-        if target_phoneme not in self.feature_vectors:
+        target_loc = self._idx.get(target_phoneme)
+        if target_loc is None:
             raise ValueError(f"Target phoneme not found: {target_phoneme}")
         
         if phoneme_list is None:
-            phoneme_list = list(self.feature_vectors.keys())
+            phoneme_list = list(self._idx)
         
         # Remove target phoneme from list if present
         search_list = [p for p in phoneme_list if p != target_phoneme]
         
-        # Calculate similarities
-        similarities = []
-        for phoneme in search_list:
-            try:
-                sim = self.phoneme_similarity(target_phoneme, phoneme)
-                similarities.append((phoneme, sim))
-            except ValueError:
-                continue
-        
-        # Sort by similarity (descending) and return top k
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:top_k]
+        # Unknown phonemes are skipped; phonemes on the other plane score 0.0
+        found = [(p, self._idx.get(p)) for p in search_list]
+        candidates = [p for p, loc in found if loc is not None]
+        locations = [loc for _, loc in found if loc is not None]
+        target_plane, target_row = target_loc
+        max_distance = (_VOWEL_PLANE, _CONSONANT_PLANE)[target_plane][0]
+        on_plane = np.array([plane == target_plane for plane, _ in locations], dtype=bool)
+        
+        # Score every same-plane candidate in one vectorized call
+        scores = np.zeros(len(candidates))
+        if on_plane.any():
+            mat = self._planes[target_plane]
+            rows = [row for plane, row in locations if plane == target_plane]
+            penalty = self._penalties[target_plane][target_row, rows][None, :]
+            scores[on_plane] = _pairwise_similarity(mat[target_row][None, :], mat[rows], max_distance, penalty)[0]
+        
+        return [(candidates[i], float(scores[i])) for i in top_k_order(scores, top_k)]
     
     def mouth_shape_distance(self, phoneme1: str, phoneme2: str) -> float:
         """
@@ -185,21 +316,18 @@ class MouthShapeSimilarity:
         Returns:
             Euclidean distance between phonemes on their respective IPA chart plane
         """
-        if phoneme1 not in self.feature_vectors or phoneme2 not in self.feature_vectors:
-            raise ValueError(f"One or both phonemes not found: {phoneme1}, {phoneme2}")
+        (plane, row1), (plane2, row2) = self._locate_pair(phoneme1, phoneme2)
         
         # Check if same type
-        both_vowels = phoneme1 in self.vowel_data and phoneme2 in self.vowel_data
-        both_consonants = phoneme1 in self.consonant_data and phoneme2 in self.consonant_data
-        
-        if not (both_vowels or both_consonants):
+        if plane != plane2:
             return float('inf')  # Incomparable - different planes
         
         # Extract coordinates (first 2 elements of vector)
-        coord1 = self.feature_vectors[phoneme1][:2]
-        coord2 = self.feature_vectors[phoneme2][:2]
+        x1, y1, _ = self._plane_rows[plane][row1]
+        x2, y2, _ = self._plane_rows[plane][row2]
+        dx, dy = x1 - x2, y1 - y2
         
-        return np.linalg.norm(coord1 - coord2)
+        return math.sqrt(dx * dx + dy * dy)
     
     def articulatory_feature_distance(self, phoneme1: str, phoneme2: str) -> float:
         """
@@ -215,21 +343,18 @@ class MouthShapeSimilarity:
         Returns:
             Distance based on articulatory features
         """
-        if phoneme1 not in self.feature_vectors or phoneme2 not in self.feature_vectors:
-            raise ValueError(f"One or both phonemes not found: {phoneme1}, {phoneme2}")
+        (plane, row1), (plane2, row2) = self._locate_pair(phoneme1, phoneme2)
         
         # Check if same type
-        both_vowels = phoneme1 in self.vowel_data and phoneme2 in self.vowel_data
-        both_consonants = phoneme1 in self.consonant_data and phoneme2 in self.consonant_data
-        
-        if not (both_vowels or both_consonants):
+        if plane != plane2:
             return float('inf')  # Incomparable - different types
         
         # Full feature vector comparison
-        feat1 = self.feature_vectors[phoneme1]
-        feat2 = self.feature_vectors[phoneme2]
+        x1, y1, f1 = self._plane_rows[plane][row1]
+        x2, y2, f2 = self._plane_rows[plane][row2]
+        dx, dy, df = x1 - x2, y1 - y2, f1 - f2
         
-        return np.linalg.norm(feat1 - feat2)
+        return math.sqrt(dx * dx + dy * dy + df * df)
     
     def is_vowel(self, phoneme: str) -> bool:
         """Check if phoneme is a vowel."""
@@ -247,6 +372,34 @@ class MouthShapeSimilarity:
         """Get list of all consonant symbols."""
         return list(self.consonant_data.keys())
     
+    def nearest_vowels(self, height: str, backness: str, roundedness: str,
+                       k: int = 1) -> List[Tuple[str, float]]:
+        """
+        Find the vowels closest to a point in height/backness/roundedness space.
+        
+        Args:
+            height: Vowel height (e.g. 'close', 'open-mid')
+            backness: Vowel backness (e.g. 'front', 'central')
+            roundedness: 'rounded' or 'unrounded'
+            k: Number of results to return
+            
+        Returns:
+            List of (vowel, distance) tuples sorted by distance
+        """
+        try:
+            query = np.array([
+                self.features['vowel_height'][height],
+                self.features['vowel_backness'][backness],
+                self.features['vowel_roundedness'][roundedness],
+            ], dtype=np.float32)
+        except KeyError as e:
+            raise ValueError(f"Unknown vowel feature value: {e.args[0]}") from None
+        
+        # Brute force over the ~30 vowels beats building a spatial index
+        distances = np.sqrt(np.sum((VOWEL_FEATURE_MATRIX - query) ** 2, axis=1))
+        order = np.argsort(distances, kind='stable')[:k]
+        return [(IPA_VOWEL_SYMBOLS[i], float(distances[i])) for i in order]
+    
     def cluster_phonemes(self, phonemes: List[str], n_clusters: int = 3) -> Dict[int, List[str]]:
         """
         Simple clustering of phonemes based on similarity.
@@ -260,43 +413,44 @@ class MouthShapeSimilarity:
         """
         from sklearn.cluster import KMeans
         
-        # Get feature vectors for the specified phonemes
-        vectors = [self.feature_vectors[p] for p in phonemes]
+        # Gather feature vectors for the specified phonemes, one fancy index per plane
+        locations = np.array([self._idx[p] for p in phonemes], dtype=np.intp).reshape(-1, 2)
+        vectors = np.empty((len(phonemes), 3))
+        for plane, matrix in enumerate(self._planes):
+            on_plane = locations[:, 0] == plane
+            vectors[on_plane] = matrix[locations[on_plane, 1]]
         
         # Perform K-means clustering
         kmeans = KMeans(n_clusters=n_clusters, random_state=42)
         cluster_labels = kmeans.fit_predict(vectors)
         
-        # Group phonemes by cluster
-        clusters = {}
-        for phoneme, label in zip(phonemes, cluster_labels):
-            if label not in clusters:
-                clusters[label] = []
-            clusters[label].append(phoneme)
-        
-        return clusters
+        # Group phonemes by cluster, clusters in order of first appearance
+        labels, first, counts = np.unique(cluster_labels, return_index=True, return_counts=True)
+        members = np.split(np.argsort(cluster_labels, kind='stable'), np.cumsum(counts)[:-1])
+        return {labels[i]: [phonemes[j] for j in members[i]] for i in np.argsort(first)}
     
     def get_phoneme_description(self, phoneme: str) -> str:
         """Get description of a phoneme."""
-        if phoneme in self.vowel_data:
-            return self.vowel_data[phoneme][-1]
-        elif phoneme in self.consonant_data:
-            return self.consonant_data[phoneme][-1]
+        entry = self.vowel_data.get(phoneme) or self.consonant_data.get(phoneme)
+        if entry is not None:
+            return entry[-1]
         else:
             return f"Phoneme {phoneme} not found"
     
     def get_phoneme_features(self, phoneme: str) -> Dict[str, str]:
         """Get articulatory features of a phoneme."""
-        if phoneme in self.vowel_data:
-            _, _, height, backness, roundedness, _ = self.vowel_data[phoneme]
+        vowel = self.vowel_data.get(phoneme)
+        consonant = self.consonant_data.get(phoneme) if vowel is None else None
+        if vowel is not None:
+            _, _, height, backness, roundedness, _ = vowel
             return {
                 'type': 'vowel',
                 'height': height,
                 'backness': backness,
                 'roundedness': roundedness
             }
-        elif phoneme in self.consonant_data:
-            _, _, manner, place, voicing, _ = self.consonant_data[phoneme]
+        elif consonant is not None:
+            _, _, manner, place, voicing, _ = consonant
             return {
                 'type': 'consonant',
                 'manner': manner,
@@ -32,6 +32,7 @@ setup(
     install_requires=[
         "numpy>=1.20.0",
         "matplotlib>=3.5.0",
+        "scipy>=1.5.0",
         "scikit-learn>=1.0.0",
     ],
     extras_require={